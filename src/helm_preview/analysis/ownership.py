@@ -28,11 +28,9 @@ def detect_ownership(resource: Resource) -> OwnershipInfo:
     labels = metadata.get("labels", {})
     annotations = metadata.get("annotations", {})
 
-    managed_by = labels.get("app.kubernetes.io/managed-by", "")
-
-    # Helm detection
+    # Helm detection (the common case, so checked first and cheapest first)
     helm_release = annotations.get("meta.helm.sh/release-name")
-    if managed_by.lower() == "helm" or helm_release:
+    if helm_release or labels.get("app.kubernetes.io/managed-by", "").lower() == "helm":
         return OwnershipInfo(
             manager="helm",
             release=helm_release or labels.get("app.kubernetes.io/instance"),
@@ -49,9 +47,8 @@ def detect_ownership(resource: Resource) -> OwnershipInfo:
         )
 
     # Flux detection
-    flux_keys = [k for k in annotations if "fluxcd.io" in k or "kustomize.toolkit.fluxcd.io" in k]
-    flux_labels = [k for k in labels if "fluxcd.io" in k or "kustomize.toolkit.fluxcd.io" in k]
-    if flux_keys or flux_labels:
+    # "kustomize.toolkit.fluxcd.io/*" keys also contain "fluxcd.io"
+    if any("fluxcd.io" in k for k in annotations) or any("fluxcd.io" in k for k in labels):
         return OwnershipInfo(manager="flux")
 
     return OwnershipInfo(manager="unknown")
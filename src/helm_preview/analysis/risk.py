@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import re
 from dataclasses import dataclass
 from enum import Enum
 from typing import Callable
@@ -24,29 +26,63 @@ class RiskAnnotation:
     path: str
 
 
+def _prefix_matcher(prefixes: list[str] | tuple[str, ...]) -> re.Pattern[str]:
+    """Compile dot-path prefixes into one regex; .match() tests startswith-any."""
+    return re.compile("|".join(map(re.escape, prefixes)))
+
+
+# Compiled at import: lowercase kind -> immutable path prefix matcher
+_IMMUTABLE_MATCHERS: dict[str, re.Pattern[str]] = {
+    kind: _prefix_matcher(paths) for kind, paths in IMMUTABLE_FIELDS.items() if paths
+}
+
+_CRD_DANGER_MATCHER = _prefix_matcher(
+    ("spec.scope", "spec.versions", "spec.validation", "spec.names")
+)
+
+
+Rule = Callable[[ChangeRecord], list[RiskAnnotation]]
+
+
+def _for_kinds(applies: Callable[[str], bool]) -> Callable[[Rule], Rule]:
+    """Restrict a rule to the kinds for which applies(kind) is true.
+
+    The returned rule returns [] for other kinds. assess_risk reads the same
+    predicate (rule.applies_to) to skip the rule up front and calls the
+    unguarded function (rule.__wrapped__) directly.
+    """
+    def decorate(rule: Rule) -> Rule:
+        @functools.wraps(rule)
+        def guarded(change: ChangeRecord) -> list[RiskAnnotation]:
+            if not applies(change.kind):
+                return []
+            return rule(change)
+
+        guarded.applies_to = applies  # type: ignore[attr-defined]
+        return guarded
+    return decorate
+
+
+@_for_kinds(lambda kind: kind.lower() in _IMMUTABLE_MATCHERS)
 def check_immutable_fields(change: ChangeRecord) -> list[RiskAnnotation]:
     """Detects changes to known immutable fields."""
-    annotations: list[RiskAnnotation] = []
-    kind_lower = change.kind.lower()
-    immutable_paths = IMMUTABLE_FIELDS.get(kind_lower, [])
+    matcher = _IMMUTABLE_MATCHERS[change.kind.lower()]
 
+    annotations: list[RiskAnnotation] = []
     for fc in change.changes:
-        for imm_path in immutable_paths:
-            if fc.path.startswith(imm_path):
-                annotations.append(RiskAnnotation(
-                    level=RiskLevel.DANGER,
-                    rule="immutable_field",
-                    message=f"Immutable field '{fc.path}' changed on {change.kind}/{change.name}",
-                    path=fc.path,
-                ))
+        if matcher.match(fc.path):
+            annotations.append(RiskAnnotation(
+                level=RiskLevel.DANGER,
+                rule="immutable_field",
+                message=f"Immutable field '{fc.path}' changed on {change.kind}/{change.name}",
+                path=fc.path,
+            ))
     return annotations
 
 
+@_for_kinds(lambda kind: kind == "Service")
 def check_service_type_change(change: ChangeRecord) -> list[RiskAnnotation]:
     """Service type changes (especially ClusterIP -> NodePort/LoadBalancer)."""
-    if change.kind != "Service":
-        return []
-
     annotations: list[RiskAnnotation] = []
     for fc in change.changes:
         if fc.path == "spec.type":
@@ -62,11 +98,9 @@ def check_service_type_change(change: ChangeRecord) -> list[RiskAnnotation]:
     return annotations
 
 
+@_for_kinds(lambda kind: kind == "PersistentVolumeClaim")
 def check_pvc_changes(change: ChangeRecord) -> list[RiskAnnotation]:
     """PVC storage size or storageClass changes."""
-    if change.kind != "PersistentVolumeClaim":
-        return []
-
     annotations: list[RiskAnnotation] = []
     for fc in change.changes:
         if "storage" in fc.path and "requests" in fc.path:
@@ -98,31 +132,24 @@ def check_resource_deletion(change: ChangeRecord) -> list[RiskAnnotation]:
     )]
 
 
+@_for_kinds(lambda kind: kind == "CustomResourceDefinition")
 def check_crd_changes(change: ChangeRecord) -> list[RiskAnnotation]:
     """CRD spec changes (schema, scope, versions) -> DANGER."""
-    if change.kind != "CustomResourceDefinition":
-        return []
-
     annotations: list[RiskAnnotation] = []
-    danger_prefixes = ("spec.scope", "spec.versions", "spec.validation", "spec.names")
     for fc in change.changes:
-        for prefix in danger_prefixes:
-            if fc.path.startswith(prefix):
-                annotations.append(RiskAnnotation(
-                    level=RiskLevel.DANGER,
-                    rule="crd_spec_change",
-                    message=f"CRD spec change at '{fc.path}' on {change.name}",
-                    path=fc.path,
-                ))
-                break
+        if _CRD_DANGER_MATCHER.match(fc.path):
+            annotations.append(RiskAnnotation(
+                level=RiskLevel.DANGER,
+                rule="crd_spec_change",
+                message=f"CRD spec change at '{fc.path}' on {change.name}",
+                path=fc.path,
+            ))
     return annotations
 
 
+@_for_kinds(lambda kind: kind in ("ClusterRole", "Role"))
 def check_rbac_escalation(change: ChangeRecord) -> list[RiskAnnotation]:
     """ClusterRole/Role rule changes -> WARNING."""
-    if change.kind not in ("ClusterRole", "Role"):
-        return []
-
     annotations: list[RiskAnnotation] = []
     for fc in change.changes:
         if fc.path.startswith("rules"):
@@ -136,7 +163,7 @@ def check_rbac_escalation(change: ChangeRecord) -> list[RiskAnnotation]:
 
 
 # Rules registry
-RISK_RULES: list[Callable[[ChangeRecord], list[RiskAnnotation]]] = [
+RISK_RULES: list[Rule] = [
     check_immutable_fields,
     check_service_type_change,
     check_pvc_changes,
@@ -146,14 +173,32 @@ RISK_RULES: list[Callable[[ChangeRecord], list[RiskAnnotation]]] = [
 ]
 
 
+@functools.lru_cache(maxsize=None)
+def _rules_for_kind(kind: str) -> tuple[Rule, ...]:
+    """RISK_RULES that can fire for kind, in registry order.
+
+    Rules restricted with _for_kinds are returned unguarded, since their
+    kind check has already been applied here; other rules apply to every
+    kind.
+    """
+    rules: list[Rule] = []
+    for rule in RISK_RULES:
+        applies = getattr(rule, "applies_to", None)
+        if applies is None:
+            rules.append(rule)
+        elif applies(kind):
+            rules.append(rule.__wrapped__)  # type: ignore[attr-defined]
+    return tuple(rules)
+
+
 def assess_risk(
     changes: list[ChangeRecord],
 ) -> list[tuple[ChangeRecord, list[RiskAnnotation]]]:
-    """Run all rules against all changes. Attach annotations."""
+    """Run the rules applicable to each change's kind. Attach annotations."""
     results: list[tuple[ChangeRecord, list[RiskAnnotation]]] = []
     for change in changes:
         annotations: list[RiskAnnotation] = []
-        for rule in RISK_RULES:
+        for rule in _rules_for_kind(change.kind):
             annotations.extend(rule(change))
         results.append((change, annotations))
     return results
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import click
-import yaml
 
 from helm_preview.analysis.ownership import OwnershipInfo, detect_ownership
 from helm_preview.analysis.risk import RiskAnnotation, assess_risk
+from helm_preview.config import SERVER_SIDE_MAX_WORKERS
 from helm_preview.core.helm import dry_run_upgrade, get_manifest
-from helm_preview.core.kubectl import server_side_dry_run
+from helm_preview.core.kubectl import (
+    _kube_flags,
+    server_side_dry_run,
+    server_side_dry_run_batch,
+)
 from helm_preview.core.runner import RunError
 from helm_preview.diff.engine import ChangeRecord, diff_all
 from helm_preview.output.json_out import render_json
@@ -18,8 +24,11 @@ from helm_preview.output.terminal import render_terminal
 from helm_preview.parser.manifest import (
     Resource,
     ResourcePair,
+    Status,
     parse_multi_doc,
+    parse_multi_doc_stream,
     pair_resources,
+    resource_from_body,
 )
 
 
@@ -84,26 +93,31 @@ def diff(
     }
 
     try:
-        # 1. Fetch live manifests
-        live_yaml = get_manifest(release, ns, **kube_opts)
-        live_resources = parse_multi_doc(live_yaml, default_namespace=ns)
-
-        # 2. Render upgrade (dry-run)
-        upgrade_yaml = dry_run_upgrade(
-            release, chart, ns,
-            values_files=list(values),
-            set_values=list(set_values),
-            version=version,
-            **kube_opts,
-        )
+        # 1-2. Fetch live manifests and render upgrade (dry-run) concurrently
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            fut_live = ex.submit(get_manifest, release, ns, **kube_opts)
+            fut_upgrade = ex.submit(
+                dry_run_upgrade,
+                release, chart, ns,
+                values_files=list(values),
+                set_values=list(set_values),
+                version=version,
+                **kube_opts,
+            )
+            live_yaml = fut_live.result()
+            upgrade_yaml = fut_upgrade.result()
+
+        # Parsed outside the thread pool: large streams fork parse workers
         upgrade_resources = parse_multi_doc(upgrade_yaml, default_namespace=ns)
 
         # 3. Optional: server-side dry-run
         if server_side:
             upgrade_resources = _apply_server_side(upgrade_resources, ns, **kube_opts)
 
-        # 4. Parse & pair
-        pairs = pair_resources(live_resources, upgrade_resources)
+        # 4. Parse live manifests straight into pairing
+        pairs = pair_resources(
+            parse_multi_doc_stream(live_yaml, default_namespace=ns), upgrade_resources
+        )
 
         # 4b. If --check-crds, separate CRD pairs from non-CRD pairs
         crd_report = None
@@ -124,15 +138,18 @@ def diff(
 
         # 7. Risk analysis + ownership
         risk_results = assess_risk(change_records)
+        # Detect ownership from the new resource (or old if removed)
+        resources_by_key = {
+            res.key: res for res in (p.new or p.old for p in non_crd_pairs) if res
+        }
         full_results: list[tuple[ChangeRecord, list[RiskAnnotation], OwnershipInfo | None]] = []
         for change, risk_annotations in risk_results:
-            # Detect ownership from the new resource (or old if removed)
-            resource = _find_resource(change, live_resources, upgrade_resources)
+            resource = resources_by_key.get(change.resource_key)
             ownership = detect_ownership(resource) if resource else None
             full_results.append((change, risk_annotations, ownership))
 
         # Count unchanged for JSON output
-        total_unchanged = sum(1 for p in non_crd_pairs if p.status == "unchanged")
+        total_unchanged = sum(1 for p in non_crd_pairs if p.status == Status.UNCHANGED)
 
         # 8. Output
         if output_format == "json":
@@ -188,35 +205,82 @@ def _run_crd_analysis(
 def _apply_server_side(
     resources: list[Resource], namespace: str, **kube_opts: str | None
 ) -> list[Resource]:
-    """Apply server-side dry-run to each resource for truth-diff mode."""
-    results: list[Resource] = []
-    for res in resources:
+    """Apply server-side dry-run to all resources for truth-diff mode.
+
+    Sends every resource through a single kubectl call; if that fails,
+    falls back to dry-running resources one by one.
+    """
+    if not resources:
+        return []
+
+    kube_flags = tuple(_kube_flags(**kube_opts))
+    try:
+        # Every document, the last included, ends with a newline
+        combined = "".join(f"---\n{_manifest_json(res)}\n" for res in resources)
+        mutated_yaml = server_side_dry_run_batch(combined, namespace, kube_flags)
+    except RunError:
+        return _apply_server_side_each(resources, namespace, kube_flags)
+
+    mutated_by_id = {
+        _identity(res): res
+        for res in _parse_dry_run_output(mutated_yaml, namespace)
+    }
+    return [mutated_by_id.get(_identity(res), res) for res in resources]
+
+
+def _apply_server_side_each(
+    resources: list[Resource], namespace: str, kube_flags: tuple[str, ...]
+) -> list[Resource]:
+    """Dry-run each resource separately, keeping the original on failure.
+
+    Dry-runs are network-bound, so they are issued concurrently; results
+    keep the input order.
+    """
+    def _one(res: Resource) -> Resource:
         try:
-            mutated_yaml = server_side_dry_run(
-                yaml.dump(res.body), namespace, **kube_opts
-            )
-            mutated = parse_multi_doc(mutated_yaml, default_namespace=namespace)
-            if mutated:
-                results.append(mutated[0])
-            else:
-                results.append(res)
+            mutated_yaml = server_side_dry_run(_manifest_json(res), namespace, kube_flags)
+            mutated = _parse_dry_run_output(mutated_yaml, namespace)
+            return mutated[0] if mutated else res
         except RunError:
             # If server-side dry-run fails for a resource, use the original
-            results.append(res)
-    return results
-
-
-def _find_resource(
-    change: ChangeRecord,
-    old_resources: list[Resource],
-    new_resources: list[Resource],
-) -> Resource | None:
-    """Find the Resource object for a change record."""
-    # Prefer new resource, fall back to old
-    for res in new_resources:
-        if res.key == change.resource_key:
             return res
-    for res in old_resources:
-        if res.key == change.resource_key:
-            return res
-    return None
+
+    with ThreadPoolExecutor(max_workers=min(SERVER_SIDE_MAX_WORKERS, len(resources))) as ex:
+        return list(ex.map(_one, resources))
+
+
+def _manifest_json(res: Resource) -> str:
+    """Compact JSON to feed kubectl for a resource, serialized from its body.
+
+    JSON is the only input format: kubectl accepts it and it is far cheaper
+    to produce than YAML. The source text is not reused because it is
+    trimmed at the end, which drops the final newline of a trailing block
+    scalar.
+    """
+    return json.dumps(res.body, separators=(",", ":"), default=str)
+
+
+def _parse_dry_run_output(output: str, namespace: str) -> list[Resource]:
+    """Parse kubectl dry-run output, unwrapping a List of several objects."""
+    resources: list[Resource] = []
+    for res in parse_multi_doc(output, default_namespace=namespace):
+        if res.kind == "List" and isinstance(res.body.get("items"), list):
+            # Items are already parsed; build Resources from them directly
+            for item in res.body["items"]:
+                item_res = resource_from_body(item, default_namespace=namespace)
+                if item_res is not None:
+                    resources.append(item_res)
+        else:
+            resources.append(res)
+    return resources
+
+
+def _identity(res: Resource) -> tuple[str, str, str, str]:
+    """Match key for dry-run results.
+
+    The server may rewrite the version in apiVersion but not the group, so
+    the group is kept: same-named kinds from different groups (e.g. Istio
+    and Gateway API Gateways) must not swap bodies.
+    """
+    group = str(res.api_version).rpartition("/")[0]
+    return (group, res.kind, res.namespace, res.name)
@@ -38,5 +38,16 @@ UNORDERED_LIST_SORT_KEYS: dict[str, str] = {
 # Default subprocess timeout in seconds
 DEFAULT_TIMEOUT = 60
 
+# Maximum concurrent kubectl calls for per-resource server-side dry-run
+SERVER_SIDE_MAX_WORKERS = 16
+
+# Minimum YAML bytes per worker process when parse_multi_doc splits a stream.
+# Sequential parsing runs at about 2 MB/s while starting a pool costs 10-30 ms,
+# so streams below two chunks (512 KiB) are parsed in-process.
+PARSE_CHUNK_MIN_BYTES = 256 * 1024
+
+# Upper bound on parse worker processes
+PARSE_MAX_WORKERS = 8
+
 # Default context lines for diff output
 DEFAULT_CONTEXT_LINES = 3
@@ -6,6 +6,10 @@ import re
 
 from helm_preview.core.runner import run
 
+# Section headers in `helm upgrade --dry-run` output
+_MANIFEST_RE = re.compile(r"^MANIFEST:\s*\n", re.MULTILINE)
+_NOTES_RE = re.compile(r"^NOTES:\s*\n", re.MULTILINE)
+
 
 def _kube_flags(**kube_opts: str | None) -> list[str]:
     """Build common kubectl/helm flags from options."""
@@ -66,13 +70,12 @@ def _strip_non_manifest(output: str) -> str:
     We want only the content after MANIFEST: and before NOTES:.
     """
     # Try to find MANIFEST: section
-    manifest_match = re.search(r"^MANIFEST:\s*\n", output, re.MULTILINE)
-    if manifest_match:
-        output = output[manifest_match.end():]
+    manifest_match = _MANIFEST_RE.search(output)
+    start = manifest_match.end() if manifest_match else 0
 
-    # Strip NOTES: section and everything after it
-    notes_match = re.search(r"^NOTES:\s*\n", output, re.MULTILINE)
-    if notes_match:
-        output = output[:notes_match.start()]
+    # Strip NOTES: section and everything after it; searching from start
+    # avoids copying the (possibly large) tail before slicing once
+    notes_match = _NOTES_RE.search(output, start)
+    end = notes_match.start() if notes_match else len(output)
 
-    return output.strip() + "\n"
+    return output[start:end].strip() + "\n"
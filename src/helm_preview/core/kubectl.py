@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Sequence
+
 from helm_preview.core.runner import run
 
 
@@ -16,11 +18,15 @@ def _kube_flags(**kube_opts: str | None) -> list[str]:
 
 
 def server_side_dry_run(
-    manifest_yaml: str, namespace: str, **kube_opts: str | None
+    manifest_yaml: str,
+    namespace: str,
+    kube_flags: Sequence[str] | None = None,
+    **kube_opts: str | None,
 ) -> str:
     """kubectl apply --dry-run=server -o yaml -f - -> post-mutation YAML.
 
-    Feeds single-resource YAML via stdin.
+    Feeds single-resource YAML via stdin. Callers issuing many dry-runs can
+    pass kube_flags prebuilt with _kube_flags() instead of kube_opts.
     """
     cmd = [
         "kubectl", "apply",
@@ -29,5 +35,19 @@ def server_side_dry_run(
         "-n", namespace,
         "-f", "-",
     ]
-    cmd += _kube_flags(**kube_opts)
+    cmd += _kube_flags(**kube_opts) if kube_flags is None else kube_flags
     return run(cmd, stdin=manifest_yaml)
+
+
+def server_side_dry_run_batch(
+    manifests_yaml: str,
+    namespace: str,
+    kube_flags: Sequence[str] | None = None,
+    **kube_opts: str | None,
+) -> str:
+    """kubectl apply --dry-run=server -o yaml -f - for a multi-doc stream.
+
+    Feeds all resources in one invocation. kubectl returns a single object
+    for one input document and a List wrapper for several.
+    """
+    return server_side_dry_run(manifests_yaml, namespace, kube_flags, **kube_opts)
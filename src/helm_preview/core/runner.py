@@ -20,14 +20,24 @@ class RunError(Exception):
 
 
 def run(cmd: list[str], timeout: int = DEFAULT_TIMEOUT, stdin: str | None = None) -> str:
-    """Run subprocess, capture stdout, raise on non-zero exit."""
-    result = subprocess.run(
+    """Run subprocess, capture stdout, raise on non-zero exit.
+
+    Pipes carry bytes and stdout is decoded once at the end, rather than
+    through a text wrapper, since manifests can run to many megabytes.
+    """
+    stdin_bytes = stdin.encode("utf-8") if stdin is not None else None
+    with subprocess.Popen(
         cmd,
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-        input=stdin,
-    )
-    if result.returncode != 0:
-        raise RunError(cmd, result.returncode, result.stderr)
-    return result.stdout
+        stdin=subprocess.PIPE if stdin_bytes is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    ) as proc:
+        try:
+            stdout, stderr = proc.communicate(stdin_bytes, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+    if proc.returncode != 0:
+        raise RunError(cmd, proc.returncode, stderr.decode("utf-8", errors="replace"))
+    return stdout.decode("utf-8")
@@ -2,12 +2,10 @@
 
 from __future__ import annotations
 
-from helm_preview.diff.engine import FieldChange, _deepdiff_path_to_dot, _extract_changes
-from helm_preview.diff.filters import normalize_body, strip_noise
+from helm_preview.diff.engine import FieldChange, diff_bodies
+from helm_preview.diff.filters import prepare_body
 from helm_preview.diff.semantic import is_semantically_equal
-from helm_preview.parser.manifest import Resource, ResourcePair
-
-from deepdiff import DeepDiff
+from helm_preview.parser.manifest import Resource, ResourcePair, Status
 
 # Additional noise paths specific to CRDs (status, timestamps, etc.)
 CRD_NOISE_PATHS = [
@@ -33,21 +31,19 @@ def pair_crds(
     old_map = {r.name: r for r in installed}
     new_map = {r.name: r for r in proposed}
 
-    all_names = list(dict.fromkeys(list(old_map.keys()) + list(new_map.keys())))
-
     pairs: list[ResourcePair] = []
-    for name in all_names:
-        old_res = old_map.get(name)
+    for name, old_res in old_map.items():
         new_res = new_map.get(name)
-
-        if old_res is None:
-            pairs.append(ResourcePair(old=None, new=new_res, status="added"))
-        elif new_res is None:
-            pairs.append(ResourcePair(old=old_res, new=None, status="removed"))
-        elif old_res.body == new_res.body:
-            pairs.append(ResourcePair(old=old_res, new=new_res, status="unchanged"))
+        if new_res is None:
+            pairs.append(ResourcePair(old=old_res, new=None, status=Status.REMOVED))
+        elif old_res.digest == new_res.digest or old_res.body == new_res.body:
+            pairs.append(ResourcePair(old=old_res, new=new_res, status=Status.UNCHANGED))
         else:
-            pairs.append(ResourcePair(old=old_res, new=new_res, status="changed"))
+            pairs.append(ResourcePair(old=old_res, new=new_res, status=Status.CHANGED))
+
+    for name, new_res in new_map.items():
+        if name not in old_map:
+            pairs.append(ResourcePair(old=None, new=new_res, status=Status.ADDED))
 
     return pairs
 
@@ -60,25 +56,23 @@ def diff_crds(pairs: list[ResourcePair]) -> list[tuple[ResourcePair, list[FieldC
     results: list[tuple[ResourcePair, list[FieldChange]]] = []
 
     for pair in pairs:
-        if pair.status in ("added", "removed"):
+        if pair.status in (Status.ADDED, Status.REMOVED):
             results.append((pair, []))
             continue
 
-        if pair.status == "unchanged":
+        if pair.status == Status.UNCHANGED:
             continue
 
         assert pair.old is not None and pair.new is not None
-        old_body = strip_noise(pair.old.body, CRD_NOISE_PATHS)
-        new_body = strip_noise(pair.new.body, CRD_NOISE_PATHS)
-
-        old_body = normalize_body(old_body)
-        new_body = normalize_body(new_body)
+        old_body = prepare_body(pair.old.body, CRD_NOISE_PATHS)
+        new_body = prepare_body(pair.new.body, CRD_NOISE_PATHS)
 
-        if is_semantically_equal(old_body, new_body):
+        if is_semantically_equal(
+            old_body, new_body, old_digest=pair.old.digest, new_digest=pair.new.digest
+        ):
             continue
 
-        dd = DeepDiff(old_body, new_body, verbose_level=2)
-        changes = _extract_changes(dd)
+        changes = diff_bodies(old_body, new_body)
 
         if changes:
             results.append((pair, changes))
@@ -6,7 +6,7 @@ import yaml
 
 from helm_preview.core.kubectl import _kube_flags
 from helm_preview.core.runner import RunError, run
-from helm_preview.parser.manifest import Resource, parse_multi_doc
+from helm_preview.parser.manifest import Resource, YamlDumper, YamlLoader, parse_multi_doc
 
 
 def discover_cluster_crds(**kube_opts: str | None) -> list[Resource]:
@@ -25,7 +25,7 @@ def discover_cluster_crds(**kube_opts: str | None) -> list[Resource]:
 
     # kubectl get -o yaml returns a List wrapper
     try:
-        data = yaml.safe_load(output)
+        data = yaml.load(output, Loader=YamlLoader)
     except yaml.YAMLError:
         return []
 
@@ -46,7 +46,7 @@ def discover_cluster_crds(**kube_opts: str | None) -> list[Resource]:
                 namespace=metadata.get("namespace", ""),
                 name=metadata.get("name", ""),
                 body=item,
-                raw=yaml.dump(item),
+                source=yaml.dump(item, Dumper=YamlDumper),
             ))
         return resources
 
@@ -75,7 +75,7 @@ def fetch_custom_resources(
         return []
 
     try:
-        data = yaml.safe_load(output)
+        data = yaml.load(output, Loader=YamlLoader)
     except yaml.YAMLError:
         return []
 
@@ -14,7 +14,7 @@ from helm_preview.crd.policy import CrdPolicyMode, evaluate_policy
 from helm_preview.crd.report import CrdChangeDetail, CrdReport
 from helm_preview.crd.schema_validator import find_schema_for_version, validate_crs_against_schema
 from helm_preview.crd.stored_versions import check_stored_version_safety
-from helm_preview.parser.manifest import Resource
+from helm_preview.parser.manifest import Resource, Status
 
 
 def run_crd_pipeline(
@@ -83,7 +83,7 @@ def run_crd_pipeline(
         crd_name = (pair.new or pair.old).name  # type: ignore[union-attr]
         detail = CrdChangeDetail(
             name=crd_name,
-            status=pair.status,
+            status=str(pair.status),
             changes=changes,
         )
 
@@ -99,11 +99,11 @@ def run_crd_pipeline(
                 detail.ownership_conflict = conflict
 
         # Step 8: Schema validation (only for changed CRDs with schemas)
-        if pair.new and pair.status == "changed":
+        if pair.new and pair.status == Status.CHANGED:
             _validate_live_crs(pair.new, detail, report, **kube_opts)
 
         # Step 9: Stored version safety
-        if pair.old and pair.new and pair.status == "changed":
+        if pair.old and pair.new and pair.status == Status.CHANGED:
             sv_warnings = check_stored_version_safety(pair.old, pair.new)
             detail.stored_version_warnings = sv_warnings
 
@@ -1,15 +1,13 @@
-"""Structural YAML diff engine using deepdiff."""
+"""Structural YAML diff engine."""
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
-from deepdiff import DeepDiff
-
 from helm_preview.diff.filters import normalize_body, strip_noise
 from helm_preview.diff.semantic import is_semantically_equal
-from helm_preview.parser.manifest import ResourcePair
+from helm_preview.parser.manifest import ResourcePair, Status
 
 
 @dataclass
@@ -39,10 +37,10 @@ def compute_diff(
 
     Returns None for unchanged resources.
     """
-    if pair.status == "unchanged":
+    if pair.status == Status.UNCHANGED:
         return None
 
-    if pair.status == "added":
+    if pair.status == Status.ADDED:
         res = pair.new
         assert res is not None
         return ChangeRecord(
@@ -53,7 +51,7 @@ def compute_diff(
             status="added",
         )
 
-    if pair.status == "removed":
+    if pair.status == Status.REMOVED:
         res = pair.old
         assert res is not None
         return ChangeRecord(
@@ -64,25 +62,30 @@ def compute_diff(
             status="removed",
         )
 
-    # status == "changed"
+    # status == Status.CHANGED
     assert pair.old is not None and pair.new is not None
-    old_body = pair.old.body
-    new_body = pair.new.body
-
-    if not show_all:
-        old_body = strip_noise(old_body, extra_ignores)
-        new_body = strip_noise(new_body, extra_ignores)
+    if pair.old.digest == pair.new.digest:
+        return None
 
-    old_body = normalize_body(old_body)
-    new_body = normalize_body(new_body)
+    if show_all:
+        old_body = normalize_body(pair.old.body)
+        new_body = normalize_body(pair.new.body)
+    else:
+        old_body = strip_noise(pair.old.body, extra_ignores)
+        new_body = strip_noise(pair.new.body, extra_ignores)
+        # Resources that differ only in noise fields need no normalization
+        if old_body == new_body:
+            return None
+        normalize_body(old_body, copy=False)
+        normalize_body(new_body, copy=False)
 
     # Check semantic equality after normalization
-    if is_semantically_equal(old_body, new_body):
+    if is_semantically_equal(
+        old_body, new_body, old_digest=pair.old.digest, new_digest=pair.new.digest
+    ):
         return None
 
-    dd = DeepDiff(old_body, new_body, verbose_level=2)
-
-    changes = _extract_changes(dd)
+    changes = diff_bodies(old_body, new_body)
 
     if not changes:
         return None
@@ -97,85 +100,49 @@ def compute_diff(
     )
 
 
-def _extract_changes(dd: DeepDiff) -> list[FieldChange]:
-    """Convert DeepDiff output to FieldChange list."""
+def diff_bodies(old: object, new: object) -> list[FieldChange]:
+    """Structurally diff two YAML trees into FieldChanges with dot-paths."""
     changes: list[FieldChange] = []
-
-    for path, detail in dd.get("values_changed", {}).items():
-        changes.append(FieldChange(
-            path=_deepdiff_path_to_dot(path),
-            old_value=detail.get("old_value"),
-            new_value=detail.get("new_value"),
-            change_type="value_changed",
-        ))
-
-    for path, detail in dd.get("type_changes", {}).items():
-        changes.append(FieldChange(
-            path=_deepdiff_path_to_dot(path),
-            old_value=detail.get("old_value"),
-            new_value=detail.get("new_value"),
-            change_type="type_changed",
-        ))
-
-    for path, value in dd.get("dictionary_item_added", {}).items():
-        changes.append(FieldChange(
-            path=_deepdiff_path_to_dot(path),
-            old_value=None,
-            new_value=value,
-            change_type="item_added",
-        ))
-
-    for path, value in dd.get("dictionary_item_removed", {}).items():
-        changes.append(FieldChange(
-            path=_deepdiff_path_to_dot(path),
-            old_value=value,
-            new_value=None,
-            change_type="item_removed",
-        ))
-
-    for path, value in dd.get("iterable_item_added", {}).items():
-        changes.append(FieldChange(
-            path=_deepdiff_path_to_dot(path),
-            old_value=None,
-            new_value=value,
-            change_type="item_added",
-        ))
-
-    for path, value in dd.get("iterable_item_removed", {}).items():
-        changes.append(FieldChange(
-            path=_deepdiff_path_to_dot(path),
-            old_value=value,
-            new_value=None,
-            change_type="item_removed",
-        ))
-
+    _walk(old, new, "", changes)
     return changes
 
 
-def _deepdiff_path_to_dot(path: str) -> str:
-    """Convert DeepDiff path like root['spec']['replicas'] to spec.replicas."""
-    # Remove root prefix
-    path = path.replace("root", "", 1)
-    # Convert ['key'] to .key and [0] to [0]
-    result = ""
-    i = 0
-    while i < len(path):
-        if path[i] == "[":
-            end = path.index("]", i)
-            inner = path[i + 1 : end]
-            if inner.startswith("'") or inner.startswith('"'):
-                # Dict key
-                key = inner.strip("'\"")
-                if result:
-                    result += "."
-                result += key
+def _walk(old: object, new: object, path: str, out: list[FieldChange]) -> None:
+    """Recursively compare old and new, appending changes found under path.
+
+    Dict keys extend the path as `.key`, list indices as `[i]`. Lists are
+    compared position by position.
+    """
+    old_type = type(old)
+    new_type = type(new)
+
+    if old_type is dict and new_type is dict:
+        for key, old_val in old.items():
+            child = f"{path}.{key}" if path else str(key)
+            if key in new:
+                _walk(old_val, new[key], child, out)
             else:
-                # List index
-                result += f"[{inner}]"
-            i = end + 1
-        else:
-            i += 1
-    return result
+                out.append(FieldChange(child, old_val, None, "item_removed"))
+        for key, new_val in new.items():
+            if key not in old:
+                child = f"{path}.{key}" if path else str(key)
+                out.append(FieldChange(child, None, new_val, "item_added"))
+        return
+
+    if old_type is list and new_type is list:
+        common = min(len(old), len(new))
+        for i in range(common):
+            _walk(old[i], new[i], f"{path}[{i}]", out)
+        for i in range(common, len(old)):
+            out.append(FieldChange(f"{path}[{i}]", old[i], None, "item_removed"))
+        for i in range(common, len(new)):
+            out.append(FieldChange(f"{path}[{i}]", None, new[i], "item_added"))
+        return
+
+    if old_type is not new_type:
+        out.append(FieldChange(path, old, new, "type_changed"))
+    elif old != new:
+        out.append(FieldChange(path, old, new, "value_changed"))
 
 
 def diff_all(
@@ -2,24 +2,17 @@
 
 from __future__ import annotations
 
-import copy
 import fnmatch
+import functools
 import re
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
 
 from helm_preview.config import NOISE_PATHS, UNORDERED_LIST_SORT_KEYS
 
 
-def strip_noise(body: dict, extra_ignores: list[str] | None = None) -> dict:
-    """Deep-copy body and remove all paths matching NOISE_PATHS + extra_ignores.
-
-    Supports glob patterns on leaf keys (e.g. annotations.prefix/*).
-    Dot-paths use backslash-escaped dots for literal dots in keys.
-    """
-    result = copy.deepcopy(body)
-    all_paths = NOISE_PATHS | set(extra_ignores or [])
-    for path in all_paths:
-        _remove_path(result, path)
-    return result
+# Dot-path separator: dots not preceded by a backslash
+_DOT_SPLIT_RE = re.compile(r'(?<!\\)\.')
 
 
 def _split_dot_path(path: str) -> list[str]:
@@ -28,74 +21,133 @@ def _split_dot_path(path: str) -> list[str]:
     e.g. 'metadata.annotations.meta\\.helm\\.sh/*' ->
          ['metadata', 'annotations', 'meta.helm.sh/*']
     """
-    # Split on dots not preceded by backslash
-    parts = re.split(r'(?<!\\)\.', path)
-    # Unescape literal dots
-    return [p.replace('\\.', '.') for p in parts]
+    # Split on dots not preceded by backslash, then unescape literal dots
+    return [p.replace('\\.', '.') for p in _DOT_SPLIT_RE.split(path)]
 
 
-def _remove_path(obj: dict, path: str) -> None:
-    """Remove a dot-path from a nested dict. Supports glob on the last segment."""
-    parts = _split_dot_path(path)
-    _remove_path_parts(obj, parts)
+@dataclass
+class _NoiseTrieNode:
+    """One dot-path segment of the compiled noise paths."""
 
+    children: dict[str, _NoiseTrieNode] = field(default_factory=dict)
+    leaves: set[str] = field(default_factory=set)
+    leaf_globs: list[Callable[[str], object]] = field(default_factory=list)
+
+
+def _build_trie(paths: Iterable[str]) -> _NoiseTrieNode:
+    """Compile dot-paths into a trie so a body is walked once for all of them."""
+    root = _NoiseTrieNode()
+    for path in paths:
+        *parents, leaf = _split_dot_path(path)
+        node = root
+        for part in parents:
+            node = node.children.setdefault(part, _NoiseTrieNode())
+        if '*' in leaf or '?' in leaf or '[' in leaf:
+            node.leaf_globs.append(re.compile(fnmatch.translate(leaf)).match)
+        else:
+            node.leaves.add(leaf)
+    return root
 
-def _remove_path_parts(obj: object, parts: list[str]) -> None:
-    """Recursively walk into obj following parts, removing the leaf."""
-    if not parts or not isinstance(obj, dict):
-        return
 
-    key = parts[0]
-    remaining = parts[1:]
-
-    if not remaining:
-        # Leaf: remove matching keys (supports glob)
-        if '*' in key or '?' in key or '[' in key:
-            to_remove = [k for k in obj if fnmatch.fnmatch(k, key)]
-            for k in to_remove:
-                del obj[k]
-        elif key in obj:
-            del obj[key]
-    else:
-        # Intermediate: recurse
-        if key in obj and isinstance(obj[key], dict):
-            _remove_path_parts(obj[key], remaining)
-
-
-def normalize_body(body: dict) -> dict:
-    """Sort dict keys recursively. Normalize known unordered lists."""
-    result = copy.deepcopy(body)
-    result = _sort_keys_recursive(result)
-    result = _sort_known_lists(result)
+_NOISE_TRIE = _build_trie(NOISE_PATHS)
+
+
+@functools.lru_cache(maxsize=16)
+def _noise_trie_with(extra_ignores: frozenset[str]) -> _NoiseTrieNode:
+    """Trie for NOISE_PATHS plus extra ignores, built once per distinct set."""
+    return _build_trie(NOISE_PATHS | extra_ignores)
+
+
+def _noise_trie(extra_ignores: list[str] | None) -> _NoiseTrieNode:
+    """Pick the precompiled trie, or an overlay including extra_ignores."""
+    if not extra_ignores:
+        return _NOISE_TRIE
+    return _noise_trie_with(frozenset(extra_ignores))
+
+
+def strip_noise(body: dict, extra_ignores: list[str] | None = None) -> dict:
+    """Copy body and remove all paths matching NOISE_PATHS + extra_ignores.
+
+    Supports glob patterns on leaf keys (e.g. annotations.prefix/*).
+    Dot-paths use backslash-escaped dots for literal dots in keys.
+    """
+    result = _clone(body)
+    _strip_trie(result, _noise_trie(extra_ignores))
     return result
 
 
-def _sort_keys_recursive(obj: object) -> object:
-    """Sort dict keys recursively, return new structure."""
-    if isinstance(obj, dict):
-        return {k: _sort_keys_recursive(v) for k, v in sorted(obj.items())}
-    if isinstance(obj, list):
-        return [_sort_keys_recursive(item) for item in obj]
+def prepare_body(body: dict, extra_ignores: list[str] | None = None) -> dict:
+    """Strip noise and normalize body, copying it only once.
+
+    Equivalent to normalize_body(strip_noise(body, extra_ignores)), but
+    noise removal and list sorting both work in place on a single clone.
+    """
+    result = _clone(body)
+    _strip_trie(result, _noise_trie(extra_ignores))
+    return _sort_known_lists(result)
+
+
+def _clone(obj: object) -> object:
+    """Copy a YAML tree of dicts, lists and scalars (no memo, unlike deepcopy)."""
+    if type(obj) is dict:
+        return {k: _clone(v) for k, v in obj.items()}
+    if type(obj) is list:
+        return [_clone(item) for item in obj]
     return obj
 
 
+def _strip_trie(obj: dict, node: _NoiseTrieNode) -> None:
+    """Walk obj alongside the trie, removing matching leaf keys in place."""
+    for key in node.leaves:
+        obj.pop(key, None)
+    if node.leaf_globs:
+        to_remove = [k for k in obj if any(match(k) for match in node.leaf_globs)]
+        for k in to_remove:
+            del obj[k]
+    for key, child in node.children.items():
+        sub = obj.get(key)
+        if isinstance(sub, dict):
+            _strip_trie(sub, child)
+
+
+def normalize_body(body: dict, copy: bool = True) -> dict:
+    """Normalize known unordered lists, on a copy of body unless copy=False.
+
+    Dict key order is left alone: dict equality and the differ are both
+    key-order-independent. Pass copy=False for a body the caller already
+    owns (e.g. one returned by strip_noise) to sort it in place.
+    """
+    return _sort_known_lists(_clone(body) if copy else body)
+
+
+# UNORDERED_LIST_SORT_KEYS with patterns pre-split into path segments
+_UNORDERED_LISTS: tuple[tuple[tuple[str, ...], str], ...] = tuple(
+    (tuple(pattern.split(".")), sort_key)
+    for pattern, sort_key in UNORDERED_LIST_SORT_KEYS.items()
+)
+
+
 def _sort_known_lists(body: dict) -> dict:
-    """Sort known unordered lists by their sort key."""
-    for path_pattern, sort_key in UNORDERED_LIST_SORT_KEYS.items():
-        _sort_list_at_path(body, path_pattern.split("."), sort_key)
+    """Sort known unordered lists by their sort key, in place."""
+    for parts, sort_key in _UNORDERED_LISTS:
+        _sort_list_at_path(body, parts, 0, sort_key)
     return body
 
 
-def _sort_list_at_path(obj: object, parts: list[str], sort_key: str) -> None:
-    """Walk the path pattern (with * wildcards for list indices) and sort the target list."""
-    if not parts:
+def _sort_list_at_path(
+    obj: object, parts: tuple[str, ...], depth: int, sort_key: str
+) -> None:
+    """Walk the path pattern (with * wildcards for list indices) and sort the target list.
+
+    depth indexes into parts, so no sub-tuples are sliced off while walking.
+    """
+    if depth >= len(parts):
         return
 
     if isinstance(obj, dict):
-        key = parts[0]
-        remaining = parts[1:]
+        key = parts[depth]
         if key in obj:
-            if not remaining:
+            if depth == len(parts) - 1:
                 # We've reached the target - sort if it's a list
                 if isinstance(obj[key], list):
                     try:
@@ -106,13 +158,9 @@ def _sort_list_at_path(obj: object, parts: list[str], sort_key: str) -> None:
                     except (TypeError, AttributeError):
                         pass
             else:
-                _sort_list_at_path(obj[key], remaining, sort_key)
+                _sort_list_at_path(obj[key], parts, depth + 1, sort_key)
     elif isinstance(obj, list):
         # * wildcard matches each list element
-        if parts[0] == "*":
-            remaining = parts[1:]
+        if parts[depth] == "*" and depth < len(parts) - 1:
             for item in obj:
-                if remaining:
-                    _sort_list_at_path(item, remaining, sort_key)
-                    continue
-                # If no remaining parts, this list element is the target
+                _sort_list_at_path(item, parts, depth + 1, sort_key)
@@ -2,69 +2,129 @@
 
 from __future__ import annotations
 
+import re
 
-def is_semantically_equal(old: dict, new: dict) -> bool:
+# Sentinel for a key absent from one side of a dict comparison
+_MISSING = object()
+
+
+def is_semantically_equal(
+    old: dict,
+    new: dict,
+    *,
+    old_digest: bytes | None = None,
+    new_digest: bytes | None = None,
+) -> bool:
     """After normalization, check if two resource bodies are semantically equivalent.
 
     Handles:
     - Numeric string vs int (e.g. port "80" vs 80)
     - Boolean string vs bool (e.g. "true" vs True)
     - null vs missing key
+
+    old_digest/new_digest are the Resource.digest values the bodies came
+    from. When both are given and match, the sources were identical and
+    the bodies are not compared at all.
     """
+    if old_digest is not None and old_digest == new_digest:
+        return True
+    # Fast path: plainly equal bodies are settled by the C-level dict/list
+    # equality without entering the semantic walk.
+    if type(old) is type(new) and old == new:
+        return True
     return _deep_semantic_equal(old, new)
 
 
 def _deep_semantic_equal(a: object, b: object) -> bool:
-    """Recursively compare two values with semantic coercion."""
-    # Direct equality
-    if a == b:
-        return True
+    """Compare two values with semantic coercion.
 
-    # None vs missing: treat None as equal to absent
-    if a is None and b is None:
-        return True
+    Walks both trees with an explicit stack of (a, b) pairs rather than
+    recursing, which saves a Python frame per nested value. Pairs that are
+    not plainly equal go to the handler for their (type, type) in
+    _DISPATCH; type pairs without a handler are unequal.
+    """
+    stack: list[tuple[object, object]] = [(a, b)]
+    while stack:
+        a, b = stack.pop()
 
-    # Numeric coercion: "80" == 80
-    if _coerce_numeric(a) is not None and _coerce_numeric(b) is not None:
-        return _coerce_numeric(a) == _coerce_numeric(b)
-
-    # Boolean coercion: "true" == True
-    if _coerce_bool(a) is not None and _coerce_bool(b) is not None:
-        return _coerce_bool(a) == _coerce_bool(b)
-
-    # Dict comparison
-    if isinstance(a, dict) and isinstance(b, dict):
-        all_keys = set(a.keys()) | set(b.keys())
-        for key in all_keys:
-            val_a = a.get(key)
-            val_b = b.get(key)
-            # Treat missing key as None
-            if not _deep_semantic_equal(val_a, val_b):
-                return False
-        return True
+        # Direct equality
+        if a == b:
+            continue
 
-    # List comparison
-    if isinstance(a, list) and isinstance(b, list):
-        if len(a) != len(b):
+        handler = _DISPATCH.get((type(a), type(b)))
+        if handler is None or not handler(a, b, stack):
             return False
-        return all(_deep_semantic_equal(x, y) for x, y in zip(a, b))
 
-    return False
+    return True
 
 
-def _coerce_numeric(val: object) -> int | float | None:
-    """Try to coerce a value to a number."""
-    if isinstance(val, (int, float)) and not isinstance(val, bool):
-        return val
-    if isinstance(val, str):
+# Handlers take (a, b, stack) and return False on a definite mismatch.
+# Container handlers push child pairs onto the stack and return True.
+
+
+def _dict_eq(a: dict, b: dict, stack: list[tuple[object, object]]) -> bool:
+    # A missing key equals None; anything else against missing differs
+    for key, val_a in a.items():
+        val_b = b.get(key, _MISSING)
+        if val_b is _MISSING:
+            if val_a is not None:
+                return False
+            continue
+        stack.append((val_a, val_b))
+    for key in b:
+        if key not in a and b[key] is not None:
+            return False
+    return True
+
+
+def _list_eq(a: list, b: list, stack: list[tuple[object, object]]) -> bool:
+    if len(a) != len(b):
+        return False
+    # a == b already failed; only unequal items need the walk
+    for item_a, item_b in zip(a, b):
+        if item_a != item_b:
+            stack.append((item_a, item_b))
+    return True
+
+
+def _num_str_eq(num: int | float, text: str) -> bool:
+    """Numeric coercion: 80 == "80"."""
+    return num == _str_to_num(text)
+
+
+def _bool_str_eq(flag: bool, text: str) -> bool:
+    """Boolean coercion: True == "true"."""
+    return flag == _coerce_bool(text)
+
+
+def _str_eq(a: str, b: str, stack: list[tuple[object, object]]) -> bool:
+    # Two numeric strings compare as numbers ("8.0" == "8"), two boolean
+    # strings as booleans ("yes" == "true").
+    if (num_a := _str_to_num(a)) is not None and (num_b := _str_to_num(b)) is not None:
+        return num_a == num_b
+    return (bool_a := _coerce_bool(a)) is not None and bool_a == _coerce_bool(b)
+
+
+# Loose shape of anything int() or float() accepts: digits, underscores,
+# points, exponents, nan/inf, sign and surrounding whitespace. Strings that
+# match may still fail to parse; strings that don't never parse, and are
+# rejected without raising.
+_NUM_RE = re.compile(
+    r"\s*[-+]?(?:[\d_.]+(?:[eE][-+]?[\d_]+)?|nan|inf(?:inity)?)\s*", re.IGNORECASE
+)
+
+
+def _str_to_num(val: str) -> int | float | None:
+    """Parse a numeric string as int, else float, else None."""
+    if _NUM_RE.fullmatch(val) is None:
+        return None
+    try:
+        return int(val)
+    except ValueError:
         try:
-            return int(val)
+            return float(val)
         except ValueError:
-            try:
-                return float(val)
-            except ValueError:
-                return None
-    return None
+            return None
 
 
 _BOOL_MAP = {
@@ -73,12 +133,33 @@ _BOOL_MAP = {
     "yes": True,
     "no": False,
 }
+# Common spellings, so most lookups avoid allocating a lowercased copy
+_BOOL_MAP.update(
+    {k.capitalize(): v for k, v in _BOOL_MAP.items()}
+    | {k.upper(): v for k, v in _BOOL_MAP.items()}
+)
+_BOOL_MAX_LEN = max(map(len, _BOOL_MAP))
 
 
 def _coerce_bool(val: object) -> bool | None:
     """Try to coerce a value to a boolean."""
-    if isinstance(val, bool):
+    val_type = type(val)
+    if val_type is bool:
         return val
-    if isinstance(val, str):
-        return _BOOL_MAP.get(val.lower())
+    if val_type is str and len(val) <= _BOOL_MAX_LEN:
+        result = _BOOL_MAP.get(val)
+        return result if result is not None else _BOOL_MAP.get(val.lower())
     return None
+
+
+_DISPATCH = {
+    (dict, dict): _dict_eq,
+    (list, list): _list_eq,
+    (str, str): _str_eq,
+    (int, str): lambda a, b, stack: _num_str_eq(a, b),
+    (float, str): lambda a, b, stack: _num_str_eq(a, b),
+    (str, int): lambda a, b, stack: _num_str_eq(b, a),
+    (str, float): lambda a, b, stack: _num_str_eq(b, a),
+    (bool, str): lambda a, b, stack: _bool_str_eq(a, b),
+    (str, bool): lambda a, b, stack: _bool_str_eq(b, a),
+}
@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 import json
+import math
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional: pip install helm-preview[orjson]
+    orjson = None
+
 from helm_preview.analysis.ownership import OwnershipInfo
 from helm_preview.analysis.risk import RiskAnnotation, RiskLevel
 from helm_preview.diff.engine import ChangeRecord
@@ -82,9 +88,51 @@ def render_json(
     if crd_report:
         output["crd_analysis"] = crd_report.to_dict()
 
+    return _dumps(output)
+
+
+def _dumps(output: dict[str, Any]) -> str:
+    """Serialize output with 2-space indent, via orjson when it is installed.
+
+    Both paths produce the same values: datetimes go through str() and
+    NaN/Infinity are left to stdlib json, which orjson would emit as null.
+    Remaining differences are formatting only: orjson writes non-ASCII as
+    UTF-8 rather than \\u escapes and omits the "+" and leading zero in
+    float exponents (1e20 rather than 1e+20).
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(
+                output,
+                default=str,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except TypeError:
+            # e.g. integers beyond 64 bits, which stdlib json handles
+            pass
+        else:
+            if b"null" not in data or not _has_non_finite(output):
+                return data.decode("utf-8")
     return json.dumps(output, indent=2, default=str)
 
 
+def _has_non_finite(value: Any) -> bool:
+    """Whether value holds a NaN or infinite float anywhere."""
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
 def _serialize_value(value: Any) -> Any:
     """Ensure value is JSON-serializable."""
     if isinstance(value, (str, int, float, bool, type(None))):
@@ -2,117 +2,368 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Literal
+import bisect
+import hashlib
+import math
+import multiprocessing
+import os
+import re
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Generator, Iterable, Iterator
 
 import yaml
 
+from helm_preview.config import PARSE_CHUNK_MIN_BYTES, PARSE_MAX_WORKERS
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # optional: pip install helm-preview[orjson]
+    orjson = None
+
+# Prefer libyaml's C implementation; the pure-Python one is several times slower.
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader  # type: ignore[assignment]
+
+    warnings.warn(
+        "PyYAML is not built with libyaml; manifest parsing will be slow",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+
+# Characters of raw text encoded and hashed per blake2b update
+_HASH_CHUNK = 64 * 1024
+
+# A line holding only a document separator
+_DOC_SEPARATOR_RE = re.compile(r"^---[ \t]*\r?$", re.MULTILINE)
+
+
+@dataclass(slots=True, frozen=True)
 class Resource:
     api_version: str
     kind: str
     namespace: str
     name: str
     body: dict
-    raw: str
+    # The raw text is source[raw_start:raw_end]. Resources parsed from one
+    # stream share that stream as their source instead of holding copies.
+    source: str = field(repr=False, compare=False)
+    raw_start: int = field(default=0, repr=False, compare=False)
+    raw_end: int | None = field(default=None, repr=False, compare=False)
+    key: str = field(init=False, repr=False, compare=False)
+    digest: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Built once and interned: keys are looked up repeatedly in pairing maps.
+        key = f"{self.api_version}/{self.kind}/{self.namespace}/{self.name}"
+        object.__setattr__(self, "key", sys.intern(key))
+        # Equal digests imply equal bodies, so pairing and diffing can skip
+        # the deep comparison when they match. Differing digests still fall
+        # back to body equality.
+        object.__setattr__(self, "digest", _digest(self))
 
     @property
-    def key(self) -> str:
-        return f"{self.api_version}/{self.kind}/{self.namespace}/{self.name}"
+    def raw(self) -> str:
+        return self.source[self.raw_start : self.raw_end]
+
+
+def _digest(res: Resource) -> bytes:
+    """16-byte blake2b of the body in canonical (sorted-key JSON) form.
+
+    Bodies that differ only in key order or formatting of the source text
+    get the same digest. Without orjson, or for bodies it cannot encode
+    exactly (timestamps, non-string keys, NaN and infinities), the raw
+    text is hashed instead, or the body's repr when there is no raw text.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    if orjson is not None:
+        try:
+            canon = orjson.dumps(
+                res.body, option=orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            )
+        except orjson.JSONEncodeError:
+            canon = None
+        # NaN and infinities encode as null, which would collide with a real
+        # null; the body is only walked for them when the output has a null.
+        if canon is not None and not (b"null" in canon and _has_non_finite(res.body)):
+            h.update(b"j")
+            h.update(canon)
+            return h.digest()
+    if not res.source:
+        # No source text to stand in for the body (see resource_from_body)
+        h.update(b"p")
+        h.update(repr(res.body).encode())
+        return h.digest()
+    h.update(b"r")
+    # Feed the raw span straight from the shared source in bounded pieces,
+    # so neither the raw substring nor its full encoding is materialized.
+    source = res.source
+    end = len(source) if res.raw_end is None else res.raw_end
+    for pos in range(res.raw_start, end, _HASH_CHUNK):
+        h.update(source[pos : min(pos + _HASH_CHUNK, end)].encode())
+    return h.digest()
+
+
+def _has_non_finite(value: object) -> bool:
+    """Whether a parsed body holds a NaN or infinite float anywhere."""
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if type(value) is float:
+            if not math.isfinite(value):
+                return True
+        elif type(value) is dict:
+            stack.extend(value.values())
+        elif type(value) is list:
+            stack.extend(value)
+    return False
+
+
+class Status(IntEnum):
+    ADDED = 0
+    REMOVED = 1
+    CHANGED = 2
+    UNCHANGED = 3
 
+    def __str__(self) -> str:
+        return self.name.lower()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ResourcePair:
     old: Resource | None
     new: Resource | None
-    status: Literal["added", "removed", "changed", "unchanged"]
+    status: Status
 
 
 def parse_multi_doc(yaml_text: str, default_namespace: str = "default") -> list[Resource]:
     """Split multi-doc YAML (---) into Resource objects.
 
     Skips empty docs and non-resource docs (those without apiVersion/kind).
+    Large streams are cut at --- separators and parsed in worker processes;
+    the result keeps document order either way.
     """
-    resources: list[Resource] = []
-    # Split on --- lines preserving each document's raw text
-    raw_docs = _split_raw_docs(yaml_text)
+    chunks = _split_for_workers(yaml_text)
+    if len(chunks) < 2:
+        return list(parse_multi_doc_stream(yaml_text, default_namespace))
 
-    for raw_doc in raw_docs:
-        stripped = raw_doc.strip()
-        if not stripped:
-            continue
+    with ProcessPoolExecutor(max_workers=len(chunks)) as ex:
+        results = ex.map(_parse_chunk, chunks, [default_namespace] * len(chunks))
+        return [_reintern(res) for chunk in results for res in chunk]
 
-        try:
-            body = yaml.safe_load(stripped)
-        except yaml.YAMLError:
-            continue
-
-        if not isinstance(body, dict):
-            continue
-
-        # Skip non-resource docs (must have apiVersion and kind)
-        if "apiVersion" not in body or "kind" not in body:
-            continue
-
-        metadata = body.get("metadata", {})
-        resources.append(Resource(
-            api_version=body["apiVersion"],
-            kind=body["kind"],
-            namespace=metadata.get("namespace", default_namespace),
-            name=metadata.get("name", ""),
-            body=body,
-            raw=stripped,
-        ))
-
-    return resources
-
-
-def _split_raw_docs(yaml_text: str) -> list[str]:
-    """Split multi-doc YAML by --- delimiters, returning raw text per doc."""
-    docs: list[str] = []
-    current_lines: list[str] = []
-
-    for line in yaml_text.splitlines(keepends=True):
-        if line.rstrip() == "---":
-            if current_lines:
-                docs.append("".join(current_lines))
-                current_lines = []
-        else:
-            current_lines.append(line)
 
-    if current_lines:
-        docs.append("".join(current_lines))
+def _parse_chunk(yaml_text: str, default_namespace: str) -> list[Resource]:
+    """Worker entry point for parse_multi_doc."""
+    return list(parse_multi_doc_stream(yaml_text, default_namespace))
+
+
+def _reintern(res: Resource) -> Resource:
+    """Re-intern the shared strings of a Resource unpickled from a worker.
+
+    Unpickling creates fresh string objects, so resources from different
+    chunks would otherwise no longer share kind/apiVersion/namespace/key.
+    """
+    for name in ("api_version", "kind", "namespace", "key"):
+        object.__setattr__(res, name, _intern(getattr(res, name)))
+    return res
+
 
-    return docs
+def _split_for_workers(yaml_text: str) -> list[str]:
+    """Cut yaml_text at --- separators into chunks of similar size, one per worker.
+
+    Each chunk holds at least PARSE_CHUNK_MIN_BYTES, so ordinary renders stay
+    a single chunk ([yaml_text]) and are parsed in-process, as they are on
+    single-CPU hosts and inside a worker process. A --- line at column 0
+    always ends a document, so the chunks parse to the same resources.
+    """
+    workers = min(PARSE_MAX_WORKERS, _usable_cpus(), len(yaml_text) // PARSE_CHUNK_MIN_BYTES)
+    if workers < 2 or multiprocessing.parent_process() is not None:
+        return [yaml_text]
+
+    separators = [m.start() for m in _DOC_SEPARATOR_RE.finditer(yaml_text)]
+    if not separators:
+        return [yaml_text]
+
+    # Cut at the first separator at or after each even split point
+    step = len(yaml_text) / workers
+    cuts: list[int] = []
+    for k in range(1, workers):
+        i = bisect.bisect_left(separators, k * step)
+        if i < len(separators) and (not cuts or separators[i] > cuts[-1]):
+            cuts.append(separators[i])
+    bounds = [0, *cuts, len(yaml_text)]
+    return [yaml_text[a:b] for a, b in zip(bounds, bounds[1:]) if a < b]
+
+
+def _usable_cpus() -> int:
+    """CPUs this process may run on, honouring affinity where the OS exposes it."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def parse_multi_doc_stream(
+    yaml_text: str, default_namespace: str = "default"
+) -> Iterator[Resource]:
+    """Like parse_multi_doc, but yields Resources one document at a time.
+
+    The stream goes through a single loader pass. Each resource's raw text
+    is its document's span in yaml_text. A malformed document is skipped
+    by restarting the loader at the next --- separator after it.
+    """
+    # No document can be a resource without these keys appearing somewhere;
+    # skip the loader entirely for NOTES-only or empty renders.
+    if "apiVersion" not in yaml_text or "kind" not in yaml_text:
+        return
+
+    offset: int | None = 0
+    while offset is not None:
+        offset = yield from _parse_from(yaml_text, offset, default_namespace)
+
+
+def _parse_from(
+    yaml_text: str, offset: int, default_namespace: str
+) -> Generator[Resource, None, int | None]:
+    """Parse yaml_text from offset until the end or the first malformed document.
+
+    Returns None at the end of the stream, otherwise the offset to resume
+    parsing from. Documents that cannot be resources are composed but never
+    constructed into Python objects.
+    """
+    loader = YamlLoader(yaml_text[offset:] if offset else yaml_text)
+    last_end = offset
+    try:
+        while loader.check_node():
+            node = loader.get_node()
+            doc_start = offset + node.start_mark.index
+            doc_end = offset + node.end_mark.index
+            if _is_resource_node(node):
+                try:
+                    body = loader.construct_document(node)
+                except yaml.YAMLError:
+                    # The parser is fine but constructor state is not; restart after this doc
+                    return doc_end
+                resource = _to_resource(
+                    body, yaml_text, doc_start, doc_end, default_namespace
+                )
+                if resource is not None:
+                    yield resource
+            last_end = doc_end
+    except yaml.YAMLError:
+        return _next_doc_offset(yaml_text, last_end)
+    finally:
+        loader.dispose()
+    return None
+
+
+def _is_resource_node(node: yaml.Node) -> bool:
+    """Whether a composed document may be a resource (top-level apiVersion and kind)."""
+    if not isinstance(node, yaml.MappingNode):
+        return False
+    keys = {key.value for key, _ in node.value if isinstance(key, yaml.ScalarNode)}
+    # A merge key (<<) could pull apiVersion/kind in; let the constructor decide
+    return ("apiVersion" in keys and "kind" in keys) or "<<" in keys
+
+
+def _next_doc_offset(yaml_text: str, pos: int) -> int | None:
+    """Offset of the first --- separator after the malformed document at pos."""
+    match = _DOC_SEPARATOR_RE.search(yaml_text, pos)
+    # A separator with nothing before it opens the malformed document itself
+    if match is not None and not yaml_text[pos:match.start()].strip():
+        match = _DOC_SEPARATOR_RE.search(yaml_text, match.end())
+    return match.start() if match is not None else None
+
+
+def _to_resource(
+    body: object, source: str, start: int, end: int, default_namespace: str
+) -> Resource | None:
+    """Build a Resource from a document parsed out of source[start:end].
+
+    Returns None for non-resource docs.
+    """
+    if not isinstance(body, dict):
+        return None
+
+    # Skip non-resource docs (must have apiVersion and kind)
+    if "apiVersion" not in body or "kind" not in body:
+        return None
+
+    metadata = body.get("metadata", {})
+    return Resource(
+        api_version=_intern(body["apiVersion"]),
+        kind=_intern(body["kind"]),
+        namespace=_intern(metadata.get("namespace", default_namespace)),
+        name=metadata.get("name", ""),
+        body=body,
+        source=source,
+        raw_start=start,
+        raw_end=_rstrip_offset(source, start, end),
+    )
+
+
+def resource_from_body(body: object, default_namespace: str = "default") -> Resource | None:
+    """Build a Resource from an already-parsed document, e.g. a List item.
+
+    The Resource has no source text; its raw is empty. Returns None for
+    non-resource docs.
+    """
+    return _to_resource(body, "", 0, 0, default_namespace)
+
+
+def _rstrip_offset(text: str, start: int, end: int) -> int:
+    """End offset of text[start:end] with trailing whitespace dropped.
+
+    A composed document starts at its first token, so only the end needs
+    trimming; this avoids building the stripped substring.
+    """
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return end
+
+
+def _intern(value: object) -> object:
+    """Intern strings drawn from a small vocabulary (kinds, apiVersions, namespaces).
+
+    Every resource of a kind then shares one string object, so the
+    kind == "Service" style checks in rules hit the identity fast path.
+    """
+    return sys.intern(value) if type(value) is str else value
 
 
 def pair_resources(
-    old: list[Resource], new: list[Resource]
+    old: Iterable[Resource], new: Iterable[Resource]
 ) -> list[ResourcePair]:
     """Match resources by key. Returns list of ResourcePair.
 
     old=None -> ADDED, new=None -> REMOVED, both -> CHANGED/UNCHANGED.
+    old may be a stream such as parse_multi_doc_stream(); it is consumed
+    straight into the keyed map. On both sides a duplicate key keeps the
+    position of its first occurrence and the resource of its last.
     """
     old_map = {r.key: r for r in old}
     new_map = {r.key: r for r in new}
 
-    all_keys = list(dict.fromkeys(list(old_map.keys()) + list(new_map.keys())))
-
     pairs: list[ResourcePair] = []
-    for key in all_keys:
-        old_res = old_map.get(key)
+    status: Status
+    for key, old_res in old_map.items():
         new_res = new_map.get(key)
 
-        if old_res is None:
-            status: Literal["added", "removed", "changed", "unchanged"] = "added"
-        elif new_res is None:
-            status = "removed"
-        elif old_res.body == new_res.body:
-            status = "unchanged"
+        if new_res is None:
+            status = Status.REMOVED
+        elif old_res.digest == new_res.digest or old_res.body == new_res.body:
+            status = Status.UNCHANGED
         else:
-            status = "changed"
+            status = Status.CHANGED
 
         pairs.append(ResourcePair(old=old_res, new=new_res, status=status))
 
+    for key, new_res in new_map.items():
+        if key not in old_map:
+            pairs.append(ResourcePair(old=None, new=new_res, status=Status.ADDED))
+
     return pairs